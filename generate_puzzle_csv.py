@@ -4,11 +4,179 @@ Generate a CSV file containing multiple word puzzles with answers.
 """
 
 import csv
-import json
+import math
+import os
+import pickle
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice, zip_longest
+import puzzle_generator
 from puzzle_generator import PuzzleGenerator
-import argparse
 
-def generate_puzzles_csv(output_file='puzzles.csv', num_puzzles=30, use_curated=False):
+# orjson is optional; it serializes the JSON columns several times faster than json
+try:
+    import orjson
+    
+    def _dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    from json import dumps as _dumps
+
+# CSV columns, in the order rows are written
+FIELDNAMES = (
+    'puzzle_id',
+    'answer',
+    'guesses_json',
+    'valid_answers_json'
+)
+
+# Output buffer size; much larger than the 8 KiB default so rows are written in few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Rows are handed to the csv writer in batches of this size; the output buffer
+# decides when they reach the file
+WRITE_BATCH = 100
+
+# Seconds between explicit flushes of the output file; bounds data loss on a crash
+FLUSH_INTERVAL = 5.0
+
+# format_constraints output template and per-type slot bytes (X = gray)
+_CONSTRAINT_TEMPLATE = b'X-X-X-X-X'
+_GRAY_BYTE = ord('X')
+_TYPE_BYTE = {'green': ord('G'), 'yellow': ord('Y')}
+
+# Minimum seconds between progress lines
+PROGRESS_INTERVAL = 5.0
+
+# Seeds dispatched per requested puzzle, so failed puzzles are replaced without a retry pass
+OVERSAMPLE = 1.2
+
+# Default location of the pickled PuzzleGenerator used by --cache
+GENERATOR_CACHE = 'puzzle_generator_cache.pkl'
+
+# Per-process generator, installed by _init_worker in each pool worker;
+# it is built in the parent so every worker uses the same word pool
+_generator = None
+
+
+def _cache_key(use_curated, curated_size):
+    """Identify the generator settings, word-list and generator code versions a cache was built from."""
+    # puzzle_generator.py is included so a pickle missing newly added attributes is rebuilt
+    mtimes = tuple(
+        os.path.getmtime(path) if os.path.exists(path) else None
+        for path in ('wordlist.txt', 'wordsWithFrequency.txt', puzzle_generator.__file__)
+    )
+    return (use_curated, curated_size, mtimes)
+
+
+def load_generator(use_curated, curated_size, cache_path=None):
+    """
+    Build a PuzzleGenerator, reusing a pickled one from cache_path when it matches.
+    
+    Args:
+        use_curated: Whether to use curated word subset
+        curated_size: Size of curated subset
+        cache_path: Optional pickle file to load from / save to
+        
+    Returns:
+        PuzzleGenerator instance
+    """
+    key = _cache_key(use_curated, curated_size)
+    
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, generator = pickle.load(f)
+            if cached_key == key:
+                return generator
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError):
+            pass
+    
+    generator = PuzzleGenerator(use_curated=use_curated, curated_size=curated_size)
+    
+    if cache_path:
+        # Write to a temp file and rename so readers never see a partial pickle
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, generator), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    
+    return generator
+
+
+def _init_worker(generator):
+    """Install the parent's PuzzleGenerator in a worker process."""
+    global _generator
+    _generator = generator
+    # Forked workers inherit the parent's random state; reseed so they don't
+    # all produce the same sequence of puzzles.
+    random.seed()
+
+
+def _safe_generate(generator, seed):
+    """
+    Generate a puzzle without raising.
+    
+    Returns:
+        (puzzle, None) on success, or (None, error message) if generation fails
+    """
+    try:
+        return generator.generate_puzzle(max_attempts=500), None
+    except Exception as e:
+        return None, f"Error generating puzzle {seed + 1}: {e}"
+
+
+def _worker(seed):
+    """
+    Generate a single puzzle.
+    
+    Returns:
+        (row, perfect) where row is a tuple of the CSV columns after puzzle_id and
+        perfect is True if the constraints uniquely identify the answer,
+        or (None, error message) on failure
+    """
+    puzzle, error = _safe_generate(_generator, seed)
+    if puzzle is None:
+        return None, error
+    
+    # Format puzzle data - store constraints as JSON for easier parsing
+    row = (
+        puzzle['answer'],
+        _dumps([
+            {
+                'word': guess or '',
+                'constraints': guess_data['constraints'] if guess_data else []
+            }
+            # Always emit 4 slots; missing guesses are padded with None
+            for _, guess, guess_data in zip_longest(range(4), puzzle['guesses'][:4], puzzle['constraints'][:4])
+        ]),
+        _dumps(puzzle.get('valid_answers', [puzzle['answer']]))
+    )
+    return row, puzzle.get('candidates_remaining', 1) == 1
+
+
+def _run_workers(executor, num_tasks, max_in_flight):
+    """
+    Run _worker over range(num_tasks), yielding results in completion order.
+    
+    Tasks are submitted one puzzle at a time and topped up as each finishes, so an
+    idle worker always picks up the next seed instead of waiting behind a slow
+    chunk, and at most max_in_flight results are pending at once.
+    """
+    seeds = iter(range(num_tasks))
+    pending = {executor.submit(_worker, seed) for seed in islice(seeds, max_in_flight)}
+    
+    while pending:
+        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in finished:
+            for seed in islice(seeds, 1):
+                pending.add(executor.submit(_worker, seed))
+            yield future.result()
+
+
+def generate_puzzles_csv(output_file='puzzles.csv', num_puzzles=30, use_curated=False, workers=None,
+                         cache_path=None):
     """
     Generate multiple puzzles and save to CSV.
     
@@ -16,63 +184,80 @@ def generate_puzzles_csv(output_file='puzzles.csv', num_puzzles=30, use_curated=
         output_file: Output CSV file path
         num_puzzles: Number of puzzles to generate
         use_curated: Whether to use curated word subset (False = use full list)
+        workers: Number of worker processes (default: os.cpu_count())
+        cache_path: Optional pickle file used to reuse the generator across runs
     """
-    print(f"Initializing puzzle generator with {'curated' if use_curated else 'full'} word list...")
-    generator = PuzzleGenerator(use_curated=use_curated, curated_size=2000)
+    workers = workers or os.cpu_count() or 1
+    print(f"Initializing {workers} puzzle generator worker(s) with {'curated' if use_curated else 'full'} word list...")
+    
+    # Build (or load) the generator once and share it, so every worker draws puzzles
+    # from the same word list; curated mode picks part of its subset at random, and
+    # separate builds per worker would each pick a different one
+    generator = load_generator(use_curated, 2000, cache_path)
     
-    print(f"Generating {num_puzzles} puzzles...")
-    puzzles = []
+    print(f"Generating {num_puzzles} puzzles into {output_file}...")
+    total = 0
+    failures = 0
+    perfect_puzzles = 0
+    answers_seen = set()
+    # Dispatch extra seeds up front and keep the first num_puzzles successes
+    num_tasks = math.ceil(num_puzzles * OVERSAMPLE)
+    last_progress = time.monotonic()
     
-    for i in range(num_puzzles):
-        if (i + 1) % 10 == 0:
-            print(f"Generated {i + 1}/{num_puzzles} puzzles...")
+    # Stream rows to the CSV in small batches as workers finish so memory stays
+    # bounded and an interrupted run keeps the puzzles generated so far
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                initargs=(generator,)) as executor:
+        writer = csv.writer(csvfile)
+        writer.writerow(FIELDNAMES)
+        batch = []
+        last_flush = time.monotonic()
         
-        try:
-            puzzle = generator.generate_puzzle(max_attempts=500)
+        for row, info in _run_workers(executor, num_tasks, max_in_flight=workers * 2):
+            if row is None:
+                # Workers hand errors back instead of printing, so all output comes from here
+                print(info)
+                failures += 1
+                continue
             
-            # Format puzzle data - store constraints as JSON for easier parsing
-            puzzle_data = {
-                'puzzle_id': i + 1,
-                'answer': puzzle['answer'],
-                'guesses_json': json.dumps([
-                    {
-                        'word': puzzle['guesses'][j] if j < len(puzzle['guesses']) else '',
-                        'constraints': puzzle['constraints'][j]['constraints'] if j < len(puzzle['constraints']) else []
-                    }
-                    for j in range(4)
-                ]),
-                'valid_answers_json': json.dumps(puzzle.get('valid_answers', [puzzle['answer']]))
-            }
+            # Results arrive in completion order, so number them as they are written
+            total += 1
+            batch.append((total, *row))
+            answers_seen.add(row[0])
+            perfect_puzzles += info
             
-            puzzles.append(puzzle_data)
+            if len(batch) >= WRITE_BATCH:
+                writer.writerows(batch)
+                batch.clear()
             
-        except Exception as e:
-            print(f"Error generating puzzle {i + 1}: {e}")
-            continue
-    
-    # Write to CSV
-    print(f"\nWriting {len(puzzles)} puzzles to {output_file}...")
-    
-    fieldnames = [
-        'puzzle_id',
-        'answer',
-        'guesses_json',
-        'valid_answers_json'
-    ]
-    
-    with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(puzzles)
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_INTERVAL:
+                print(f"Generated {total}/{num_puzzles} puzzles...")
+                last_progress = now
+            if now - last_flush >= FLUSH_INTERVAL:
+                writer.writerows(batch)
+                batch.clear()
+                csvfile.flush()
+                last_flush = now
+            
+            if total == num_puzzles:
+                break
+        
+        writer.writerows(batch)
+        # Drop the oversampled seeds that are still queued
+        executor.shutdown(cancel_futures=True)
     
-    print(f"✓ Successfully generated {len(puzzles)} puzzles in {output_file}")
+    if total < num_puzzles:
+        print(f"Warning: only {total} of {num_puzzles} puzzles could be generated")
     
-    # Print summary
-    unique_answers = len(set(p['answer'] for p in puzzles))
+    print(f"✓ Successfully generated {total} puzzles in {output_file}")
     
     print(f"\nSummary:")
-    print(f"  Total puzzles: {len(puzzles)}")
-    print(f"  Unique answers: {unique_answers}")
+    print(f"  Total puzzles: {total}")
+    print(f"  Unique answers: {len(answers_seen)}")
+    print(f"  Perfect puzzles: {perfect_puzzles}")
+    print(f"  Failed attempts: {failures}")
 
 
 def format_constraints(constraints):
@@ -83,22 +268,18 @@ def format_constraints(constraints):
     if not constraints:
         return ''
     
-    # Create array of constraint types by position
-    constraint_array = ['X'] * 5  # X = gray by default
+    # Slot for position i is byte i*2 of the template; unknown types stay gray
+    buf = bytearray(_CONSTRAINT_TEMPLATE)
     for constraint in constraints:
-        pos = constraint['position']
-        constraint_type = constraint['type']
-        if constraint_type == 'green':
-            constraint_array[pos] = 'G'
-        elif constraint_type == 'yellow':
-            constraint_array[pos] = 'Y'
-        else:
-            constraint_array[pos] = 'X'
+        buf[constraint['position'] * 2] = _TYPE_BYTE.get(constraint['type'], _GRAY_BYTE)
     
-    return '-'.join(constraint_array)
+    return buf.decode('ascii')
 
 
 def main():
+    # Imported here so pool workers, which import this module, skip it
+    import argparse
+    
     parser = argparse.ArgumentParser(description='Generate word puzzle CSV file')
     parser.add_argument('-n', '--num', type=int, default=30,
                        help='Number of puzzles to generate (default: 30)')
@@ -106,13 +287,19 @@ def main():
                        help='Output CSV file path (default: puzzles.csv)')
     parser.add_argument('--curated', action='store_true',
                        help='Use curated word subset instead of full list (faster but less comprehensive)')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                       help='Number of worker processes (default: number of CPUs)')
+    parser.add_argument('--cache', action='store_true',
+                       help=f'Reuse a pickled puzzle generator from {GENERATOR_CACHE} (built on first use)')
     
     args = parser.parse_args()
     
     generate_puzzles_csv(
         output_file=args.output,
         num_puzzles=args.num,
-        use_curated=args.curated
+        use_curated=args.curated,
+        workers=args.workers,
+        cache_path=GENERATOR_CACHE if args.cache else None
     )
 
 
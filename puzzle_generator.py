@@ -8,8 +8,12 @@ Uses efficient constraint satisfaction approach.
 import random
 from typing import List, Tuple, Dict, Set, Optional
 from collections import Counter, defaultdict
+from itertools import accumulate, compress
 import os
 
+# Shared empty result for index lookups that match no words
+_NO_WORDS = frozenset()
+
 class WordleConstraints:
     """Represents Wordle-style constraints (green, yellow, gray)."""
     
@@ -17,6 +21,69 @@ class WordleConstraints:
     YELLOW = 'yellow'
     GRAY = 'gray'
     
+    @staticmethod
+    def get_pattern(guess: str, answer: str) -> int:
+        """
+        Get the constraint pattern for a guess word against an answer as a single int.
+        Position i contributes one base-3 digit, type * 3**i, with gray=0, yellow=1, green=2,
+        so the 243 possible patterns fit in 0..242.
+        
+        Args:
+            guess: The guess word
+            answer: The answer word
+            
+        Returns:
+            Packed pattern; constraints_from_pattern turns it back into get_constraints' list
+        """
+        # Words are always 5 letters, so the green pass is unrolled over local variables
+        g0, g1, g2, g3, g4 = guess
+        a0, a1, a2, a3, a4 = answer
+        pattern = 0
+        others = []  # (letter, 3**position) of every non-green guess letter
+        unmatched = []  # answer letters not used by a green
+        
+        # First pass: mark greens (exact matches)
+        if g0 == a0:
+            pattern += 2
+        else:
+            others.append((g0, 1))
+            unmatched.append(a0)
+        if g1 == a1:
+            pattern += 6
+        else:
+            others.append((g1, 3))
+            unmatched.append(a1)
+        if g2 == a2:
+            pattern += 18
+        else:
+            others.append((g2, 9))
+            unmatched.append(a2)
+        if g3 == a3:
+            pattern += 54
+        else:
+            others.append((g3, 27))
+            unmatched.append(a3)
+        if g4 == a4:
+            pattern += 162
+        else:
+            others.append((g4, 81))
+            unmatched.append(a4)
+        
+        # Second pass: mark yellows (letter in word but wrong position), each using up
+        # one unmatched copy of the letter; everything else stays gray (0)
+        for letter, weight in others:
+            if letter in unmatched:
+                pattern += weight
+                unmatched.remove(letter)
+        
+        return pattern
+    
+    @staticmethod
+    def constraints_from_pattern(guess: str, pattern: int) -> List[Tuple[str, int, str]]:
+        """Expand a get_pattern result into (letter, position, constraint_type) tuples."""
+        types = _PATTERN_TYPES[pattern]
+        return [(guess[i], i, types[i]) for i in _PATTERN_ORDER[pattern]]
+    
     @staticmethod
     def get_constraints(guess: str, answer: str) -> List[Tuple[str, int, str]]:
         """
@@ -30,27 +97,7 @@ class WordleConstraints:
         Returns:
             List of (letter, position, constraint_type) where constraint_type is 'green', 'yellow', or 'gray'
         """
-        constraints = []
-        answer_counts = Counter(answer)
-        used_positions = set()
-        
-        # First pass: mark greens (exact matches)
-        for i in range(5):
-            if guess[i] == answer[i]:
-                constraints.append((guess[i], i, WordleConstraints.GREEN))
-                used_positions.add(i)
-                answer_counts[guess[i]] -= 1
-        
-        # Second pass: mark yellows (letter in word but wrong position)
-        for i in range(5):
-            if i not in used_positions:
-                if guess[i] in answer_counts and answer_counts[guess[i]] > 0:
-                    constraints.append((guess[i], i, WordleConstraints.YELLOW))
-                    answer_counts[guess[i]] -= 1
-                else:
-                    constraints.append((guess[i], i, WordleConstraints.GRAY))
-        
-        return constraints
+        return WordleConstraints.constraints_from_pattern(guess, WordleConstraints.get_pattern(guess, answer))
     
     @staticmethod
     def word_satisfies_constraints(word: str, constraints: List[Tuple[str, int, str]]) -> bool:
@@ -64,41 +111,61 @@ class WordleConstraints:
         Returns:
             True if word satisfies all constraints
         """
-        word_counts = Counter(word)
-        constraint_counts = Counter()
-        
-        # Check green constraints (exact position matches)
+        # Letter counts indexed by ord(letter) - 97, as in get_constraints
+        word_counts = [0] * 26
+        for letter in word:
+            word_counts[ord(letter) - 97] += 1
+        constraint_counts = [0] * 26
+        gray_codes = []
+        
+        # Check green constraints (exact position matches) and yellow constraints
+        # (letter in word but not at this position) in one pass
         for letter, pos, constraint_type in constraints:
+            code = ord(letter) - 97
             if constraint_type == WordleConstraints.GREEN:
                 if word[pos] != letter:
                     return False
-                constraint_counts[letter] += 1
-        
-        # Check yellow constraints (letter in word but not at this position)
-        for letter, pos, constraint_type in constraints:
-            if constraint_type == WordleConstraints.YELLOW:
-                if word[pos] == letter:  # Can't be at this position
+                constraint_counts[code] += 1
+            elif constraint_type == WordleConstraints.YELLOW:
+                if word[pos] == letter or not word_counts[code]:  # Can't be at this position
                     return False
-                if letter not in word:
-                    return False
-                constraint_counts[letter] += 1
+                constraint_counts[code] += 1
+            elif constraint_type == WordleConstraints.GRAY:
+                gray_codes.append(code)
         
         # Check gray constraints (letter not in word)
-        for letter, pos, constraint_type in constraints:
-            if constraint_type == WordleConstraints.GRAY:
-                if letter in word:
-                    # But only if it's not required by green/yellow
-                    if constraint_counts[letter] >= word_counts[letter]:
-                        return False
+        for code in gray_codes:
+            if word_counts[code]:
+                # But only if it's not required by green/yellow
+                if constraint_counts[code] >= word_counts[code]:
+                    return False
         
         # Verify minimum letter counts (for yellows and greens)
-        for letter, count in constraint_counts.items():
-            if word_counts[letter] < count:
+        for letter, _, constraint_type in constraints:
+            code = ord(letter) - 97
+            if word_counts[code] < constraint_counts[code]:
                 return False
         
         return True
 
 
+def _pattern_tables():
+    """Per-pattern constraint types, and positions in get_constraints order (greens first)."""
+    digit_types = (WordleConstraints.GRAY, WordleConstraints.YELLOW, WordleConstraints.GREEN)
+    pattern_types = []
+    pattern_order = []
+    for pattern in range(3 ** 5):
+        types = tuple(digit_types[pattern // 3 ** i % 3] for i in range(5))
+        pattern_types.append(types)
+        pattern_order.append(
+            tuple(i for i in range(5) if types[i] == WordleConstraints.GREEN) +
+            tuple(i for i in range(5) if types[i] != WordleConstraints.GREEN)
+        )
+    return pattern_types, pattern_order
+
+_PATTERN_TYPES, _PATTERN_ORDER = _pattern_tables()
+
+
 class LetterFrequencyAnalyzer:
     """Analyzes letter frequencies for better word selection."""
     
@@ -115,26 +182,29 @@ class LetterFrequencyAnalyzer:
     @staticmethod
     def compute_frequencies(words: List[str]) -> Dict[str, float]:
         """Compute letter frequencies from word list."""
-        total_letters = 0
-        letter_counts = Counter()
-        
-        for word in words:
-            for letter in word:
-                letter_counts[letter] += 1
-                total_letters += 1
+        # Counting the joined string runs in C and keeps the same first-seen key order
+        all_letters = ''.join(words)
+        letter_counts = Counter(all_letters)
+        total_letters = len(all_letters)
         
         return {letter: count / total_letters for letter, count in letter_counts.items()}
     
     @staticmethod
     def compute_position_frequencies(words: List[str]) -> List[Dict[str, float]]:
         """Compute letter frequencies for each position (0-4)."""
-        position_counts = [Counter() for _ in range(5)]
-        position_totals = [0] * 5
-        
-        for word in words:
-            for pos, letter in enumerate(word):
-                position_counts[pos][letter] += 1
-                position_totals[pos] += 1
+        all_letters = ''.join(words)
+        if len(all_letters) == 5 * len(words) and all(len(word) == 5 for word in words):
+            # Every word is 5 letters, so position pos is every 5th letter starting at pos
+            position_counts = [Counter(all_letters[pos::5]) for pos in range(5)]
+            position_totals = [len(words)] * 5
+        else:
+            position_counts = [Counter() for _ in range(5)]
+            position_totals = [0] * 5
+            
+            for word in words:
+                for pos, letter in enumerate(word):
+                    position_counts[pos][letter] += 1
+                    position_totals[pos] += 1
         
         return [
             {letter: count / position_totals[pos] 
@@ -180,8 +250,9 @@ class PuzzleGenerator:
             curated_size: Size of curated subset to use
             min_answer_frequency: Minimum frequency for answer words (soft constraint)
         """
+        # Read each file in one go and lowercase it once, rather than line by line
         with open(wordlist_path, 'r') as f:
-            all_words = [line.strip().lower() for line in f if line.strip()]
+            all_words = [word for word in map(str.strip, f.read().lower().splitlines()) if word]
         
         # Load word frequencies from file
         self.word_frequencies = {}
@@ -189,15 +260,15 @@ class PuzzleGenerator:
         if os.path.exists(frequency_path):
             print(f"Loading word frequencies from {frequency_path}...")
             with open(frequency_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if ',' in line:
-                        word, freq_str = line.rsplit(',', 1)
-                        try:
-                            freq = float(freq_str)
-                            self.word_frequencies[word.lower()] = freq
-                        except ValueError:
-                            continue
+                lines = f.read().lower().splitlines()
+            for line in lines:
+                word, sep, freq_str = line.strip().rpartition(',')
+                if sep:
+                    try:
+                        freq = float(freq_str)
+                        self.word_frequencies[word] = freq
+                    except ValueError:
+                        continue
             print(f"Loaded frequencies for {len(self.word_frequencies)} words")
         else:
             print(f"Warning: Frequency file {frequency_path} not found, using default scoring")
@@ -221,6 +292,25 @@ class PuzzleGenerator:
         
         self.word_set = set(self.words)
         
+        # Inverted indexes for find_candidates, so each constraint is one set operation:
+        # words_at[pos][letter] holds the words with letter at pos, and
+        # words_with_count[(letter, n)] the words containing letter at least n times.
+        # letter_masks[word] has bit ord(letter) - 97 set for each distinct letter of word.
+        self.words_at = [defaultdict(set) for _ in range(5)]
+        self.words_with_count = defaultdict(set)
+        self.letter_masks = {}
+        for word in self.words:
+            for pos, letter in enumerate(word):
+                self.words_at[pos][letter].add(word)
+            mask = 0
+            for letter, count in Counter(word).items():
+                mask |= 1 << (ord(letter) - 97)
+                for n in range(1, count + 1):
+                    self.words_with_count[(letter, n)].add(word)
+            self.letter_masks[word] = mask
+        self.words_at = [dict(index) for index in self.words_at]
+        self.words_with_count = dict(self.words_with_count)
+        
         # Pre-compute frequency data for optimization
         self.letter_freqs = LetterFrequencyAnalyzer.compute_frequencies(self.words)
         self.position_freqs = LetterFrequencyAnalyzer.compute_position_frequencies(self.words)
@@ -237,6 +327,11 @@ class PuzzleGenerator:
             else:
                 self.word_scores[word] = base_score
         
+        # Pre-select candidate guesses based on frequency scores
+        # Use top-scoring words + some diversity
+        sorted_words = sorted(self.words, key=lambda w: self.word_scores.get(w, 0), reverse=True)
+        self.top_candidates = sorted_words[:min(500, len(sorted_words))]
+        
         # Pre-compute answer candidates (words with sufficient frequency)
         self.answer_candidates = [
             w for w in self.words 
@@ -245,6 +340,13 @@ class PuzzleGenerator:
         if not self.answer_candidates:
             self.answer_candidates = self.words  # Fallback to all words
         
+        # Cumulative answer weights for random.choices, so picking an answer
+        # doesn't rebuild them over every candidate on each generate_puzzle call
+        self.answer_cum_weights = list(accumulate(
+            self.word_frequencies.get(w, 0.0) + 1.0  # Add 1 to avoid zero weights
+            for w in self.answer_candidates
+        ))
+        
         print(f"Loaded {len(self.words)} words with frequency analysis")
         print(f"Answer candidates: {len(self.answer_candidates)} words (freq >= {self.min_answer_frequency:.2f})")
     
@@ -255,25 +357,28 @@ class PuzzleGenerator:
         position_freqs = LetterFrequencyAnalyzer.compute_position_frequencies(words)
         
         # Score all words
-        scored_words = [
-            (word, LetterFrequencyAnalyzer.word_score(word, position_freqs, letter_freqs))
+        scores = [
+            LetterFrequencyAnalyzer.word_score(word, position_freqs, letter_freqs)
             for word in words
         ]
         
-        # Sort by score (higher = more informative/common)
-        scored_words.sort(key=lambda x: x[1], reverse=True)
+        # Sort word indices by score (higher = more informative/common); the sort is
+        # stable, so ties keep word-list order
+        ranked = sorted(range(len(words)), key=scores.__getitem__, reverse=True)
         
         # Take top N, but also add some random diversity
-        selected = set()
-        
         # Top 70% by score
         top_count = int(size * 0.7)
-        for word, _ in scored_words[:top_count]:
-            selected.add(word)
-        
-        # Add 30% random for diversity
+        top_indices = ranked[:top_count]
+        selected = {words[i] for i in top_indices}
+        
+        # Add 30% random for diversity, drawn from the unselected words in word-list order.
+        # Clearing the top words' flags and compressing keeps the whole scan in C.
+        unselected = bytearray(b'\x01') * len(words)
+        for i in top_indices:
+            unselected[i] = 0
         remaining = size - len(selected)
-        random_words = random.sample([w for w in words if w not in selected], 
+        random_words = random.sample(list(compress(words, unselected)), 
                                      min(remaining, len(words) - len(selected)))
         selected.update(random_words)
         
@@ -290,84 +395,65 @@ class PuzzleGenerator:
             candidate_set: Optional pre-filtered candidate set to start with
             
         Returns:
-            List of candidate words
+            List of candidate words, in no particular order
         """
-        if candidate_set is None:
-            candidates = set(self.words)
-        else:
-            candidates = candidate_set.copy()
+        # Set operations in _apply_filter always build new sets, so the inputs are never modified
+        candidates = self.word_set if candidate_set is None else candidate_set
         
         # Apply constraints sequentially, filtering as we go
         for constraints in constraints_list:
             if not candidates:
                 break  # Early termination
-            
-            new_candidates = set()
-            
-            # Pre-process constraints for faster checking
-            green_positions = {pos: letter for letter, pos, ct in constraints 
-                             if ct == WordleConstraints.GREEN}
-            yellow_letters = {letter for letter, _, ct in constraints 
-                            if ct == WordleConstraints.YELLOW}
-            yellow_forbidden_positions = {pos: letter for letter, pos, ct in constraints 
-                                        if ct == WordleConstraints.YELLOW}
-            
-            # Pre-compute required letter counts for fast filtering
-            required_letters = Counter()
-            for letter, _, ct in constraints:
-                if ct in (WordleConstraints.GREEN, WordleConstraints.YELLOW):
-                    required_letters[letter] += 1
-            
-            # Quick filter: check green constraints first (fastest, most restrictive)
-            for word in candidates:
-                # Fast path: green constraints (most restrictive)
-                valid = True
-                for pos, letter in green_positions.items():
-                    if word[pos] != letter:
-                        valid = False
-                        break
-                
-                if not valid:
-                    continue
-                
-                # Fast path: check if word has all required letters
-                word_letter_counts = Counter(word)
-                for letter, required_count in required_letters.items():
-                    if word_letter_counts[letter] < required_count:
-                        valid = False
-                        break
-                
-                if not valid:
-                    continue
-                
-                # Fast path: yellow constraints (letter exists but not at forbidden position)
-                for letter in yellow_letters:
-                    if letter not in word:
-                        valid = False
-                        break
-                
-                if not valid:
-                    continue
-                
-                # Check yellow forbidden positions
-                for pos, forbidden_letter in yellow_forbidden_positions.items():
-                    if word[pos] == forbidden_letter:
-                        valid = False
-                        break
-                
-                if not valid:
-                    continue
-                
-                # Full constraint check (handles edge cases like gray constraints)
-                if WordleConstraints.word_satisfies_constraints(word, constraints):
-                    new_candidates.add(word)
-            
-            candidates = new_candidates
-            # Early termination if no candidates remain
+            candidates = self._apply_filter(candidates, self._constraint_filter(constraints))
+        
+        # Callers mostly need the count, so leave sorting to the few that need ordering
+        return list(candidates)
+    
+    def _constraint_filter(self, constraints: List[Tuple[str, int, str]]) -> Tuple[List[Set[str]], List[Set[str]]]:
+        """
+        Translate one constraint set into index sets: (sets a word must be in, sets it must not be in).
+        The required sets are ordered smallest first so intersections shrink the candidates quickly.
+        """
+        required = []
+        excluded = []
+        required_letters = Counter()
+        
+        # Greens must sit at their position; yellow letters can't sit at their guessed position
+        for letter, pos, ct in constraints:
+            if ct == WordleConstraints.GREEN:
+                required.append(self.words_at[pos].get(letter, _NO_WORDS))
+                required_letters[letter] += 1
+            elif ct == WordleConstraints.YELLOW:
+                excluded.append(self.words_at[pos].get(letter, _NO_WORDS))
+                required_letters[letter] += 1
+        
+        # Same rule as word_satisfies_constraints: a gray letter only matters when
+        # green/yellow constraints also use it, and then the word needs one more copy
+        min_counts = dict(required_letters)
+        for letter, _, ct in constraints:
+            if ct == WordleConstraints.GRAY and letter in required_letters:
+                min_counts[letter] = required_letters[letter] + 1
+        
+        for letter_count in min_counts.items():
+            required.append(self.words_with_count.get(letter_count, _NO_WORDS))
+        
+        required.sort(key=len)
+        return required, excluded
+    
+    @staticmethod
+    def _apply_filter(candidates: Set[str], word_filter: Tuple[List[Set[str]], List[Set[str]]]) -> Set[str]:
+        """Return the candidates that pass a _constraint_filter result, as a new set."""
+        required, excluded = word_filter
+        for words in required:
+            candidates = candidates & words
             if not candidates:
-                break
+                return candidates
+        
+        # Subtract last, once the intersections have made the candidate set small
+        for words in excluded:
+            candidates = candidates - words
         
-        return sorted(candidates)
+        return candidates
     
     def generate_puzzle(self, answer: str = None, max_attempts: int = 500) -> Dict:
         """
@@ -386,11 +472,7 @@ class PuzzleGenerator:
             if self.answer_candidates:
                 # Weight selection by frequency (higher frequency = more likely)
                 if self.word_frequencies:
-                    weights = [
-                        self.word_frequencies.get(w, 0.0) + 1.0  # Add 1 to avoid zero weights
-                        for w in self.answer_candidates
-                    ]
-                    answer = random.choices(self.answer_candidates, weights=weights, k=1)[0]
+                    answer = random.choices(self.answer_candidates, cum_weights=self.answer_cum_weights, k=1)[0]
                 else:
                     answer = random.choice(self.answer_candidates)
             else:
@@ -410,18 +492,22 @@ class PuzzleGenerator:
         best_candidates_remaining = len(self.words)
         best_final_candidates = []
         
-        # Pre-select candidate guesses based on frequency scores
-        # Use top-scoring words + some diversity
-        sorted_words = sorted(self.words, key=lambda w: self.word_scores.get(w, 0), reverse=True)
-        top_candidates = sorted_words[:min(500, len(sorted_words))]
+        # Early attempts draw their guesses from the top-scoring words
+        top_candidates = self.top_candidates[:min(300, len(self.top_candidates))]
         
         # Cache for constraint results to avoid recomputation
         constraint_cache = {}
+        letter_masks = self.letter_masks
+        
+        # The answer is fixed for this call, so each guess's constraints, their index-set
+        # filter and the part of its score that depends only on them are computed once
+        # and reused across attempts
+        guess_constraints = {}
         
         for attempt in range(max_attempts):
             guesses = []
             constraints_list = []
-            used_letters = set()
+            used_mask = 0  # letter_masks bits of every letter in the chosen guesses
             current_candidates = None  # Track candidates incrementally
             
             # Try to pick 4 diverse, informative words
@@ -434,7 +520,7 @@ class PuzzleGenerator:
                 # Sample from top candidates, but add some randomness
                 if attempt < max_attempts // 2:
                     # Early attempts: focus on high-frequency words
-                    candidate_pool = top_candidates[:min(300, len(top_candidates))]
+                    candidate_pool = top_candidates
                 else:
                     # Later attempts: more diversity
                     candidate_pool = random.sample(self.words, min(400, len(self.words)))
@@ -442,29 +528,42 @@ class PuzzleGenerator:
                 # Pruning: If we have very few candidates, we can still use any guess
                 # (guesses don't need to be in current candidates to be useful)
                 
+                # Results for this slot depend only on the earlier guesses (the answer is
+                # fixed), so they are cached per set of earlier guesses, keyed by guess
+                slot_cache = constraint_cache.setdefault(frozenset(guesses), {})
+                
                 for guess in candidate_pool:
                     if guess == answer or guess in guesses:
                         continue
                     
                     # Prefer words with letters we haven't tested much
-                    guess_letters = set(guess)
-                    overlap = len(guess_letters & used_letters)
+                    overlap = bin(letter_masks[guess] & used_mask).count('1')
                     if overlap > 3 and guess_num < 2:  # Early guesses should explore
                         continue
                     
                     # Compute constraints
-                    constraints = WordleConstraints.get_constraints(guess, answer)
-                    constraints_list_copy = constraints_list + [constraints]
+                    if guess in guess_constraints:
+                        constraints, word_filter, constraint_score = guess_constraints[guess]
+                    else:
+                        pattern = WordleConstraints.get_pattern(guess, answer)
+                        constraints = WordleConstraints.constraints_from_pattern(guess, pattern)
+                        word_filter = self._constraint_filter(constraints)
+                        pattern_types = _PATTERN_TYPES[pattern]
+                        green_count = pattern_types.count(WordleConstraints.GREEN)
+                        yellow_count = pattern_types.count(WordleConstraints.YELLOW)
+                        constraint_score = green_count * 5 + yellow_count * 2
+                        guess_constraints[guess] = (constraints, word_filter, constraint_score)
                     
-                    # Check cache key (simplified - could be more sophisticated)
-                    cache_key = tuple(sorted((g, answer) for g in guesses + [guess]))
-                    if cache_key in constraint_cache:
-                        remaining = constraint_cache[cache_key]
+                    if guess in slot_cache:
+                        remaining, solved = slot_cache[guess]
                     else:
-                        # Check how many candidates remain (use incremental filtering)
-                        candidates = self.find_candidates(constraints_list_copy, current_candidates)
+                        # Check how many candidates remain; current_candidates already satisfies
+                        # the earlier guesses, so only this guess's filter needs applying
+                        candidates = self._apply_filter(
+                            self.word_set if current_candidates is None else current_candidates, word_filter)
                         remaining = len(candidates)
-                        constraint_cache[cache_key] = remaining
+                        solved = remaining == 1 and answer in candidates
+                        slot_cache[guess] = (remaining, solved)
                     
                     # Early termination: if no candidates, skip
                     if remaining == 0:
@@ -478,15 +577,19 @@ class PuzzleGenerator:
                         if reduction < len(current_candidates) * 0.1:  # Less than 10% reduction
                             continue
                     
+                    # On the last slot, a guess that leaves only the answer completes a
+                    # perfect puzzle, so there is no need to score the rest of the pool
+                    if solved and guess_num == 3:
+                        best_guess = guess
+                        best_constraints_for_guess = constraints
+                        best_remaining = remaining
+                        break
+                    
                     # Score based on:
                     # 1. Information gain (how many candidates eliminated)
                     # 2. Constraint diversity (green/yellow are more informative)
                     # 3. Word frequency score (common letters are more likely)
-                    green_count = sum(1 for _, _, ct in constraints if ct == WordleConstraints.GREEN)
-                    yellow_count = sum(1 for _, _, ct in constraints if ct == WordleConstraints.YELLOW)
-                    
                     info_gain = (len(current_candidates) if current_candidates else len(self.words)) - remaining
-                    constraint_score = green_count * 5 + yellow_count * 2
                     frequency_bonus = self.word_scores.get(guess, 0) * 100
                     diversity_penalty = overlap * 20  # Penalize too much overlap
                     
@@ -503,11 +606,13 @@ class PuzzleGenerator:
                 
                 guesses.append(best_guess)
                 constraints_list.append(best_constraints_for_guess)
-                used_letters.update(set(best_guess))
+                used_mask |= letter_masks[best_guess]
                 
                 # Update current candidates incrementally (for next iteration)
                 if best_constraints_for_guess:
-                    current_candidates = set(self.find_candidates(constraints_list))
+                    current_candidates = self._apply_filter(
+                        self.word_set if current_candidates is None else current_candidates,
+                        guess_constraints[best_guess][1])
                     # Early termination if we've found the answer
                     if len(current_candidates) == 1 and answer in current_candidates:
                         break
@@ -515,10 +620,11 @@ class PuzzleGenerator:
             if len(guesses) < 4:
                 continue
             
-            # Check if we have exactly one candidate (the answer)
-            final_candidates = self.find_candidates(constraints_list)
+            # Check if we have exactly one candidate (the answer); current_candidates has
+            # had every guess's filter applied, so it is already the final candidate set
+            final_candidates = current_candidates
             
-            if len(final_candidates) == 1 and final_candidates[0] == answer:
+            if len(final_candidates) == 1 and answer in final_candidates:
                 # Success! Format the result
                 result = {
                     'answer': answer,
@@ -573,7 +679,7 @@ class PuzzleGenerator:
             result['candidates_remaining'] = best_candidates_remaining
             # Store all valid answers (candidates that satisfy all constraints)
             if best_candidates_remaining > 1:
-                result['valid_answers'] = best_final_candidates
+                result['valid_answers'] = sorted(best_final_candidates)
             else:
                 # For unique puzzles, valid_answers is just the answer
                 result['valid_answers'] = [answer]
@@ -4,45 +4,107 @@ Web server for the constraint-based word puzzle game.
 """
 
 from flask import Flask, jsonify, send_from_directory, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import random
-import uuid
 import csv
+import gzip
+import hashlib
 import json
+import mimetypes
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+from collections import OrderedDict
+
+# orjson is optional; it parses and serializes the CSV columns, query parameters and
+# API responses several times faster than json
+try:
+    import orjson
+    from orjson import loads as _loads
+    
+    def _dumps(obj):
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    orjson = None
+    from json import loads as _loads
+    
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':'))
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider using orjson for jsonify and request.json."""
+    
+    # Arguments orjson can honour; separators can be ignored since its output is always compact
+    _ORJSON_KWARGS = frozenset(('indent', 'separators', 'sort_keys'))
+    
+    def dumps(self, obj, **kwargs):
+        # Anything orjson has no option for goes through the standard json provider
+        if not kwargs.keys() <= self._ORJSON_KWARGS:
+            return super().dumps(obj, **kwargs)
+        
+        option = orjson.OPT_SORT_KEYS if kwargs.get('sort_keys', self.sort_keys) else 0
+        if kwargs.get('indent'):
+            # jsonify pretty-prints with indent=2 in debug mode, which is orjson's only indent
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__, static_folder='static')
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 app.secret_key = 'your-secret-key-change-in-production'  # Change this in production
 CORS(app)
 
 # Load puzzles from CSV file
 PUZZLES_CSV = 'puzzles.csv'
 puzzles_db = []
+puzzles_by_id = {}  # puzzle_id -> entry of puzzles_db
+puzzle_id_set = frozenset()  # IDs of every puzzle in puzzles_db
+puzzle_ids = ()  # The same IDs as a tuple, for O(1) random picks
 
 def load_puzzles_from_csv():
     """Load puzzles from CSV file."""
-    global puzzles_db
+    global puzzles_db, puzzles_by_id, puzzle_id_set, puzzle_ids
     puzzles_db = []
+    puzzles_by_id = {}
+    puzzle_id_set = frozenset()
+    puzzle_ids = ()
     
     if not os.path.exists(PUZZLES_CSV):
-        app.logger.warning(f"Puzzles CSV file '{PUZZLES_CSV}' not found. Run generate_puzzle_csv.py first.")
+        app.logger.warning("Puzzles CSV file '%s' not found. Run generate_puzzle_csv.py first.", PUZZLES_CSV)
         return
     
     try:
         with open(PUZZLES_CSV, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+            reader = csv.reader(csvfile)
+            # Resolve column positions from the header once rather than building a dict per row
+            header = next(reader, [])
+            id_col = header.index('puzzle_id')
+            answer_col = header.index('answer')
+            guesses_col = header.index('guesses_json')
+            valid_answers_col = header.index('valid_answers_json') if 'valid_answers_json' in header else None
+            
             for row in reader:
-                puzzle_id = int(row['puzzle_id'])
-                answer = row['answer']
-                guesses_data = json.loads(row['guesses_json'])
+                if not row:
+                    continue
+                
+                puzzle_id = int(row[id_col])
+                answer = row[answer_col]
+                guesses_data = _loads(row[guesses_col])
                 
                 # Load valid answers (all words that satisfy constraints)
                 # For backwards compatibility, default to just the answer if not present
-                valid_answers_json = row.get('valid_answers_json', '')
+                valid_answers_json = ''
+                if valid_answers_col is not None and valid_answers_col < len(row):
+                    valid_answers_json = row[valid_answers_col]
                 if valid_answers_json:
                     try:
-                        valid_answers = json.loads(valid_answers_json)
+                        valid_answers = _loads(valid_answers_json)
                     except (json.JSONDecodeError, ValueError):
                         valid_answers = [answer]
                 else:
@@ -52,54 +114,138 @@ def load_puzzles_from_csv():
                     'puzzle_id': puzzle_id,
                     'answer': answer,
                     'guesses': guesses_data,
-                    'valid_answers': valid_answers
+                    # Puzzles never change after loading, so the guesses part of the
+                    # /api/puzzle response is serialized once here
+                    'guesses_response': _dumps(frontend_guesses(guesses_data)),
+                    # Lowercased once here so checking a guess is a single set lookup
+                    'valid_answers': frozenset(a.lower() for a in valid_answers)
                 })
         
-        app.logger.info(f"Loaded {len(puzzles_db)} puzzles from {PUZZLES_CSV}")
+        puzzles_by_id = {p['puzzle_id']: p for p in puzzles_db}
+        puzzle_id_set = frozenset(puzzles_by_id)
+        puzzle_ids = tuple(puzzle_id_set)
+        app.logger.info("Loaded %d puzzles from %s", len(puzzles_db), PUZZLES_CSV)
     except Exception as e:
-        app.logger.error(f"Error loading puzzles from CSV: {e}")
+        app.logger.error("Error loading puzzles from CSV: %s", e)
         puzzles_db = []
+        puzzles_by_id = {}
+        puzzle_id_set = frozenset()
+        puzzle_ids = ()
+
+def frontend_guesses(guesses_data):
+    """Convert a puzzle's guesses to the format the frontend expects."""
+    guesses = []
+    for guess_data in guesses_data:
+        word = guess_data['word']
+        constraints = guess_data['constraints']
+        
+        # Create a simple array representation: [type, type, type, type, type]
+        constraint_array = ['gray'] * 5
+        for constraint in constraints:
+            pos = constraint['position']
+            constraint_type = constraint['type']
+            constraint_array[pos] = constraint_type
+        
+        guesses.append({
+            'word': word,
+            'constraints': constraint_array
+        })
+    
+    return guesses
 
 # Load puzzles on startup
 load_puzzles_from_csv()
 
 # Load word list for validation
-word_set = set()
+word_set = frozenset()
 def load_word_list():
     """Load word list for validation."""
     global word_set
     wordlist_path = 'wordlist.txt'
     if os.path.exists(wordlist_path):
         try:
+            # Read and lowercase the whole file at once; the set is never modified after loading
             with open(wordlist_path, 'r', encoding='utf-8') as f:
-                word_set = {line.strip().lower() for line in f if line.strip()}
-            app.logger.info(f"Loaded {len(word_set)} words for validation")
+                word_set = frozenset(word for word in map(str.strip, f.read().lower().splitlines()) if word)
+            app.logger.info("Loaded %d words for validation", len(word_set))
         except Exception as e:
-            app.logger.error(f"Error loading word list: {e}")
-            word_set = set()
+            app.logger.error("Error loading word list: %s", e)
+            word_set = frozenset()
     else:
-        app.logger.warning(f"Word list file '{wordlist_path}' not found. Word validation disabled.")
+        app.logger.warning("Word list file '%s' not found. Word validation disabled.", wordlist_path)
 
 load_word_list()
 
 # Store active puzzles (in production, use Redis or database)
-# Format: {puzzle_id: {'answer': str, 'created_at': datetime, 'guesses': list}}
-active_puzzles = {}
+# Format: {puzzle_id: {'answer': str, 'created_at': float, 'last_used': float (time.monotonic()),
+#                      'guesses': [{'guess': str, 'timestamp_ns': int (time.time_ns())}]}}
+# Kept in least recently used order, so eviction and expiry both work from the front
+active_puzzles = OrderedDict()
+
+# Guards active_puzzles, which request threads reorder as well as update
+_state_lock = threading.Lock()
+
+# Seconds a puzzle can go unused before cleanup removes it
+PUZZLE_TTL = 60 * 60
+
+# Most active puzzles kept at once; beyond this the least recently used are evicted
+MAX_ACTIVE_PUZZLES = 50000
+
+# Random draws choose_unserved_puzzle_id tries before falling back to a set difference
+UNSERVED_DRAWS = 8
+
+# Static files kept in memory, read and gzip-compressed once at startup
+# Format: {filename: (raw bytes, gzipped bytes, etag, mimetype)}
+static_cache = {}
+def load_static_files():
+    """Load and precompress the static files served by the routes below."""
+    for filename in ('index.html', 'style.css', 'app.js'):
+        path = os.path.join('static', filename)
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+        except OSError as e:
+            # Leave it to send_from_directory, which reports the missing file per request
+            app.logger.warning("Could not cache static file '%s': %s", path, e)
+            continue
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        static_cache[filename] = (raw, gzip.compress(raw), hashlib.sha1(raw).hexdigest(), mimetype)
+
+load_static_files()
+
+def serve_static(filename):
+    """Serve a static file from memory, gzipped when the client accepts it."""
+    cached = static_cache.get(filename)
+    # In debug mode read from disk so edits show up without a restart
+    if cached is None or app.debug:
+        return send_from_directory('static', filename)
+    
+    raw, gzipped, etag, mimetype = cached
+    if request.accept_encodings['gzip'] > 0:  # Quality 0 means "not acceptable"
+        response = app.response_class(gzipped, mimetype=mimetype)
+        response.headers['Content-Encoding'] = 'gzip'
+        etag += '-gzip'  # Each encoding is a different representation
+    else:
+        response = app.response_class(raw, mimetype=mimetype)
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    # Answers If-None-Match with a 304 and no body
+    return response.make_conditional(request)
 
 @app.route('/')
 def index():
     """Serve the main page."""
-    return send_from_directory('static', 'index.html')
+    return serve_static('index.html')
 
 @app.route('/style.css')
 def serve_css():
     """Serve CSS file."""
-    return send_from_directory('static', 'style.css')
+    return serve_static('style.css')
 
 @app.route('/app.js')
 def serve_js():
     """Serve JavaScript file."""
-    return send_from_directory('static', 'app.js')
+    return serve_static('app.js')
 
 @app.route('/api/puzzle', methods=['GET'])
 def get_puzzle():
@@ -113,69 +259,55 @@ def get_puzzle():
         served_param = request.args.get('served', '')
         if served_param:
             try:
-                served_list = json.loads(served_param)
+                served_list = _loads(served_param)
                 served_by_user = {int(pid) for pid in served_list if str(pid).isdigit()}
             except (json.JSONDecodeError, ValueError):
                 # Invalid format, treat as empty
                 pass
         
-        # Get all puzzle database IDs
-        all_puzzle_ids = {p['puzzle_id'] for p in puzzles_db}
-        
-        # Find puzzles not yet served to this user
-        unserved_ids = all_puzzle_ids - served_by_user
+        # Select a random puzzle from those not yet served to this user
+        selected_db_id = choose_unserved_puzzle_id(served_by_user)
         
         # If all puzzles have been served to this user, return a message
-        if not unserved_ids:
+        if selected_db_id is None:
             return jsonify({
                 'error': 'No new puzzle available at the moment. All puzzles have been served. Please try again later.'
             }), 503  # 503 Service Unavailable
         
-        # Select a random puzzle from unserved puzzles
-        selected_db_id = random.choice(list(unserved_ids))
-        puzzle = next(p for p in puzzles_db if p['puzzle_id'] == selected_db_id)
+        puzzle = puzzles_by_id[selected_db_id]
         
-        # Generate unique puzzle ID for this session
-        puzzle_id = str(uuid.uuid4())
+        # Generate unique puzzle ID for this session (128 random bits, like a uuid4)
+        puzzle_id = os.urandom(16).hex()
         
         # Store puzzle answer and valid answers server-side (don't trust client)
-        active_puzzles[puzzle_id] = {
+        now = time.monotonic()
+        puzzle_data = {
             'answer': puzzle['answer'],
-            'valid_answers': puzzle.get('valid_answers', [puzzle['answer']]),  # All words that satisfy constraints
-            'created_at': datetime.now(),
+            'valid_answers': puzzle['valid_answers'],  # All words that satisfy constraints
+            'created_at': now,
+            'last_used': now,
             'guesses': []
         }
+        with _state_lock:
+            active_puzzles[puzzle_id] = puzzle_data
+            # Bound memory during bursts that create many puzzles within the hour
+            while len(active_puzzles) > MAX_ACTIVE_PUZZLES:
+                active_puzzles.popitem(last=False)
         
-        # Clean up old puzzles (older than 1 hour)
+        # Clean up puzzles unused for an hour
         cleanup_old_puzzles()
         
-        # Format for frontend
-        response = {
-            'puzzle_id': puzzle_id,
-            'puzzle_db_id': selected_db_id,  # Include database ID so client can track it
-            'guesses': []
-        }
+        # Format for frontend; only the session puzzle ID differs between requests,
+        # the guesses were converted and serialized when the CSV was loaded
+        response = '{"puzzle_id":%s,"puzzle_db_id":%d,"guesses":%s}' % (
+            _dumps(puzzle_id),
+            selected_db_id,  # Include database ID so client can track it
+            puzzle['guesses_response']
+        )
         
-        # Convert guesses data to frontend format
-        for guess_data in puzzle['guesses']:
-            word = guess_data['word']
-            constraints = guess_data['constraints']
-            
-            # Create a simple array representation: [type, type, type, type, type]
-            constraint_array = ['gray'] * 5
-            for constraint in constraints:
-                pos = constraint['position']
-                constraint_type = constraint['type']
-                constraint_array[pos] = constraint_type
-            
-            response['guesses'].append({
-                'word': word,
-                'constraints': constraint_array
-            })
-        
-        return jsonify(response)
+        return app.response_class(response, mimetype='application/json')
     except Exception as e:
-        app.logger.error(f"Error loading puzzle: {e}")
+        app.logger.error("Error loading puzzle: %s", e)
         return jsonify({'error': 'Failed to load puzzle. Please try again.'}), 500
 
 @app.route('/api/check', methods=['POST'])
@@ -207,21 +339,27 @@ def check_answer():
             return jsonify({'correct': False, 'message': f'"{guess.upper()}" is not a valid word'}), 400
         
         # Get answer from server-side storage (don't trust client)
-        if puzzle_id not in active_puzzles:
+        with _state_lock:
+            puzzle_data = active_puzzles.get(puzzle_id)
+            if puzzle_data is not None:
+                # Puzzles still being played are the last to be evicted or expired
+                active_puzzles.move_to_end(puzzle_id)
+                puzzle_data['last_used'] = time.monotonic()
+        if puzzle_data is None:
             return jsonify({'correct': False, 'message': 'Puzzle not found or expired. Please start a new puzzle.'}), 404
         
-        puzzle_data = active_puzzles[puzzle_id]
-        answer = puzzle_data['answer']
-        valid_answers = puzzle_data.get('valid_answers', [answer])
+        valid_answers = puzzle_data['valid_answers']
         
-        # Track guess
+        # Track guess; nothing reads the timestamps back, so store the raw integer
+        # rather than formatting an ISO string on every check
         puzzle_data['guesses'].append({
             'guess': guess,
-            'timestamp': datetime.now().isoformat()
+            'timestamp_ns': time.time_ns()
         })
         
         # Check if correct - accept any word that satisfies all constraints
-        correct = (guess.lower() in [a.lower() for a in valid_answers])
+        # (guess is already lowercased and valid_answers was lowercased at load)
+        correct = guess in valid_answers
         
         response_data = {
             'correct': correct,
@@ -237,19 +375,32 @@ def check_answer():
         return jsonify(response_data)
         
     except Exception as e:
-        app.logger.error(f"Error checking answer: {e}")
+        app.logger.error("Error checking answer: %s", e)
         return jsonify({'correct': False, 'message': 'Server error. Please try again.'}), 500
 
 
 def cleanup_old_puzzles():
-    """Remove puzzles older than 1 hour."""
-    now = datetime.now()
-    expired_ids = [
-        pid for pid, data in active_puzzles.items()
-        if now - data['created_at'] > timedelta(hours=1)
-    ]
-    for pid in expired_ids:
-        del active_puzzles[pid]
+    """Remove puzzles unused for over an hour."""
+    # active_puzzles is least recently used first, so stop at the first puzzle still in use
+    cutoff = time.monotonic() - PUZZLE_TTL
+    with _state_lock:
+        while active_puzzles and next(iter(active_puzzles.values()))['last_used'] < cutoff:
+            active_puzzles.popitem(last=False)
+
+
+def choose_unserved_puzzle_id(served_ids):
+    """Return a random puzzle ID not in served_ids, or None if all have been served."""
+    # Draw from all IDs and retry when the pick was already served. This is still
+    # uniform over the unserved IDs, and while most puzzles are unserved it finds
+    # one in a few draws without building a list of them on every request.
+    for _ in range(UNSERVED_DRAWS):
+        puzzle_id = random.choice(puzzle_ids)
+        if puzzle_id not in served_ids:
+            return puzzle_id
+    
+    # Most puzzles have been served to this user; pick from the exact remainder
+    unserved_ids = puzzle_id_set - served_ids
+    return random.choice(tuple(unserved_ids)) if unserved_ids else None
 
 if __name__ == '__main__':
     app.run(debug=True, port=8000)